@@ -42,6 +42,8 @@ Usage:
     access_result, privacy_result = tool.apply_full_security(contract, catalog)
 """
 
+from importlib import import_module
+
 # Access Control (Table-level)
 from .models import (
     UCPrivilege,
@@ -52,9 +54,7 @@ from .models import (
 )
 
 from .metadata_loader import AccessMetadataLoader
-from .uc_inspector import UCPrivilegeInspector
 from .delta_generator import PrivilegeDeltaGenerator
-from .grant_revoker import GrantRevoker
 
 # Privacy/Masking (Column-level)
 from .privacy_models import (
@@ -69,12 +69,34 @@ from .privacy_models import (
 )
 
 from .masking_functions import MaskingFunctions
-from .uc_masking_inspector import UCMaskingInspector
 from .privacy_metadata_loader import PrivacyMetadataLoader
-from .privacy_engine import PrivacyEngine
 
-# Standalone Tool (Access + Privacy)
-from .standalone import StandaloneAccessControlTool
+# Components that need a Spark session (and therefore pyspark) are
+# imported on first access, so importing the models/enums stays cheap.
+_LAZY_IMPORTS = {
+    "UCPrivilegeInspector": ".uc_inspector",
+    "GrantRevoker": ".grant_revoker",
+    "UCMaskingInspector": ".uc_masking_inspector",
+    "PrivacyEngine": ".privacy_engine",
+    # Standalone Tool (Access + Privacy)
+    "StandaloneAccessControlTool": ".standalone",
+}
+
+
+def __getattr__(name):
+    """Import Spark-dependent components on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "1.1.0"
 
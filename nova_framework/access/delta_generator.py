@@ -5,10 +5,16 @@ Compares intended privileges vs actual privileges to generate
 the changes needed (GRANTs and REVOKEs).
 """
 
+from collections import Counter
 from typing import List, Tuple
 from .models import PrivilegeIntent, ActualPrivilege, PrivilegeDelta
 
 
+# Bitmask flags used by generate_deltas
+_INTENDED = 1
+_ACTUAL = 2
+
+
 class PrivilegeDeltaGenerator:
     """
     Generate privilege deltas by comparing intent vs actual.
@@ -66,39 +72,53 @@ class PrivilegeDeltaGenerator:
             # ]
             # no_change = 1  # g1 already correct
         """
-        deltas = []
-        
-        # Convert to sets for efficient comparison
-        # Uses __hash__ and __eq__ from PrivilegeIntent/ActualPrivilege
-        intent_set = set(intents)
-        actual_set = set(actuals)
-        
-        # Find GRANTs needed (in intent but not actual)
-        to_grant = intent_set - actual_set
-        
-        for intent in to_grant:
-            deltas.append(PrivilegeDelta(
-                action="GRANT",
-                table=intent.table,
-                ad_group=intent.ad_group,
-                privilege=intent.privilege,
-                reason=intent.reason
-            ))
-        
-        # Find REVOKEs needed (in actual but not intent)
-        to_revoke = actual_set - intent_set
-        
-        for actual in to_revoke:
-            deltas.append(PrivilegeDelta(
-                action="REVOKE",
-                table=actual.table,
-                ad_group=actual.ad_group,
-                privilege=actual.privilege,
-                reason="Not in current metadata - removing"
-            ))
-        
-        # Count privileges already correct (in both sets)
-        no_change_count = len(intent_set & actual_set)
+        # Single keyed pass over both lists instead of building two sets
+        # and taking three set differences. Each key maps to a bitmask
+        # (1 = intended, 2 = actual) plus the first object seen for it,
+        # so the intent's reason is preserved for GRANTs.
+        state = {}
+        
+        for intent in intents:
+            key = (intent.table, intent.ad_group, intent.privilege)
+            if key not in state:
+                state[key] = [_INTENDED, intent]
+        
+        for actual in actuals:
+            key = (actual.table, actual.ad_group, actual.privilege)
+            entry = state.get(key)
+            if entry is None:
+                state[key] = [_ACTUAL, actual]
+            else:
+                entry[0] |= _ACTUAL
+        
+        grants = []
+        revokes = []
+        no_change_count = 0
+        
+        for (table, ad_group, privilege), (mask, source) in state.items():
+            if mask == _INTENDED:
+                # In intent but not actual → GRANT needed
+                grants.append(PrivilegeDelta(
+                    action="GRANT",
+                    table=table,
+                    ad_group=ad_group,
+                    privilege=privilege,
+                    reason=source.reason
+                ))
+            elif mask == _ACTUAL:
+                # In actual but not intent → REVOKE needed
+                revokes.append(PrivilegeDelta(
+                    action="REVOKE",
+                    table=table,
+                    ad_group=ad_group,
+                    privilege=privilege,
+                    reason="Not in current metadata - removing"
+                ))
+            else:
+                # In both → already correct
+                no_change_count += 1
+        
+        deltas = grants + revokes
         
         return deltas, no_change_count
     
@@ -155,22 +175,26 @@ class PrivilegeDeltaGenerator:
             #   }
             # }
         """
-        summary = {
-            "total": len(deltas),
-            "grants": sum(1 for d in deltas if d.action == "GRANT"),
-            "revokes": sum(1 for d in deltas if d.action == "REVOKE"),
-            "by_privilege": {},
-            "by_group": {}
-        }
+        grants = 0
+        revokes = 0
+        by_privilege = Counter()
+        by_group = Counter()
         
-        # Count by privilege
+        # Single pass over deltas
         for delta in deltas:
-            priv = delta.privilege.value
-            summary["by_privilege"][priv] = summary["by_privilege"].get(priv, 0) + 1
+            if delta.action == "GRANT":
+                grants += 1
+            else:
+                revokes += 1
+            by_privilege[delta.privilege.value] += 1
+            by_group[delta.ad_group] += 1
         
-        # Count by group
-        for delta in deltas:
-            group = delta.ad_group
-            summary["by_group"][group] = summary["by_group"].get(group, 0) + 1
+        summary = {
+            "total": len(deltas),
+            "grants": grants,
+            "revokes": revokes,
+            "by_privilege": dict(by_privilege),
+            "by_group": dict(by_group)
+        }
         
         return summary
\ No newline at end of file
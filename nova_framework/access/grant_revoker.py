@@ -5,9 +5,25 @@ Executes privilege changes (deltas) by running GRANT and REVOKE SQL statements.
 """
 
 import time
-from typing import List
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 from pyspark.sql import SparkSession
-from .models import PrivilegeDelta, AccessControlResult
+from .models import (
+    PrivilegeDelta,
+    AccessControlResult,
+    UCPrivilege,
+    PRIVILEGE_SQL_TEMPLATES
+)
+from nova_framework.observability import get_logger
+
+logger = get_logger("access.grant_revoker")
+
+# Error messages retained on each AccessControlResult
+MAX_RESULT_ERRORS = 100
+
+# Statements queued per worker thread at any one time
+IN_FLIGHT_PER_WORKER = 2
 
 
 class GrantRevoker:
@@ -17,6 +33,12 @@ class GrantRevoker:
     Handles execution of privilege deltas with error handling,
     success/failure tracking, and optional dry-run mode.
 
+    Deltas sharing the same action, table and AD group are collapsed
+    into a single multi-privilege statement (e.g. GRANT SELECT, MODIFY),
+    and the resulting statements are submitted concurrently. Each
+    statement is a round-trip to Unity Catalog, so this turns N serial
+    round-trips into roughly N / max_workers.
+
     Usage:
         revoker = GrantRevoker(spark=spark, dry_run=False)
 
@@ -29,16 +51,23 @@ class GrantRevoker:
         )
     """
 
-    def __init__(self, spark: SparkSession, dry_run: bool = False):
+    def __init__(
+        self,
+        spark: SparkSession,
+        dry_run: bool = False,
+        max_workers: int = 8
+    ):
         """
         Initialize grant/revoke executor.
 
         Args:
             spark: Active Spark session with UC access
             dry_run: If True, preview SQL without executing
+            max_workers: Maximum number of statements submitted concurrently
         """
         self.spark = spark
         self.dry_run = dry_run
+        self.max_workers = max(1, max_workers)
 
     def apply_deltas(
         self,
@@ -85,35 +114,37 @@ class GrantRevoker:
         revokes_attempted = 0
         revokes_succeeded = 0
         revokes_failed = 0
-        errors = []
 
-        # Process each delta
-        for delta in deltas:
-            if delta.action == "GRANT":
-                grants_attempted += 1
-
-                try:
-                    if not self.dry_run:
-                        self.spark.sql(delta.sql)
-                    grants_succeeded += 1
+        # Only the most recent errors are kept on the result; every error
+        # is logged as it happens so nothing is lost for auditing
+        errors = deque(maxlen=MAX_RESULT_ERRORS)
+        error_count = 0
 
-                except Exception as e:
-                    grants_failed += 1
-                    error_msg = f"GRANT failed for {delta.ad_group}: {str(e)}"
-                    errors.append(error_msg)
+        batches = self._batch_deltas(deltas)
 
-            elif delta.action == "REVOKE":
-                revokes_attempted += 1
+        # Counters are reduced here on the calling thread, so workers
+        # never touch shared state
+        for results in self._execute_batches(batches):
+            for delta, error in results:
+                if error is not None:
+                    error_count += 1
+                    logger.error(f"{delta.action} failed: {delta.sql}: {error}")
 
-                try:
-                    if not self.dry_run:
-                        self.spark.sql(delta.sql)
-                    revokes_succeeded += 1
+                if delta.action == "GRANT":
+                    grants_attempted += 1
+                    if error is None:
+                        grants_succeeded += 1
+                    else:
+                        grants_failed += 1
+                        errors.append(f"GRANT failed for {delta.ad_group}: {error}")
 
-                except Exception as e:
-                    revokes_failed += 1
-                    error_msg = f"REVOKE failed for {delta.ad_group}: {str(e)}"
-                    errors.append(error_msg)
+                elif delta.action == "REVOKE":
+                    revokes_attempted += 1
+                    if error is None:
+                        revokes_succeeded += 1
+                    else:
+                        revokes_failed += 1
+                        errors.append(f"REVOKE failed for {delta.ad_group}: {error}")
 
         execution_time = time.time() - start_time
 
@@ -130,11 +161,189 @@ class GrantRevoker:
             revokes_succeeded=revokes_succeeded,
             revokes_failed=revokes_failed,
             execution_time_seconds=execution_time,
-            errors=errors
+            errors=list(errors),
+            errors_dropped=error_count - len(errors)
         )
 
         return result
 
+    def _batch_deltas(
+        self,
+        deltas: List[PrivilegeDelta]
+    ) -> List[List[PrivilegeDelta]]:
+        """
+        Group deltas that can be applied with a single statement.
+
+        Deltas are grouped by (action, table, ad_group). ALL PRIVILEGES
+        is kept in its own batch since UC does not accept it alongside
+        individual privileges in one statement.
+
+        Args:
+            deltas: Privilege deltas to group
+
+        Returns:
+            List of batches, in first-seen order
+        """
+        batches: Dict[Tuple[str, str, str, bool], List[PrivilegeDelta]] = {}
+
+        for delta in deltas:
+            key = (
+                delta.action,
+                delta.table,
+                delta.ad_group,
+                delta.privilege == UCPrivilege.ALL_PRIVILEGES
+            )
+            batches.setdefault(key, []).append(delta)
+
+        return list(batches.values())
+
+    @staticmethod
+    def _batch_sql(batch: List[PrivilegeDelta]) -> str:
+        """
+        Render the SQL statement for a batch of deltas.
+
+        Args:
+            batch: Deltas sharing action, table and AD group
+
+        Returns:
+            Single GRANT or REVOKE statement covering every privilege
+
+        Examples:
+            GRANT SELECT, MODIFY ON TABLE catalog.schema.table TO `ad_group`
+            REVOKE SELECT ON TABLE catalog.schema.table FROM `ad_group`
+        """
+        if len(batch) == 1:
+            return batch[0].sql
+
+        first = batch[0]
+        privileges = ", ".join(d.privilege.value for d in batch)
+
+        return PRIVILEGE_SQL_TEMPLATES[first.action].format(
+            privileges, first.table, first.ad_group
+        )
+
+    def _execute_batches(self, batches: List[List[PrivilegeDelta]]):
+        """
+        Execute batched statements concurrently.
+
+        Batches for the same (table, ad_group) form one work unit that runs
+        sequentially on a single worker, GRANTs before REVOKEs, so e.g.
+        GRANT SELECT and REVOKE ALL PRIVILEGES on one group always apply
+        in that order. Only independent units run in parallel.
+
+        Args:
+            batches: Batches produced by _batch_deltas
+
+        Yields:
+            List of (delta, error) pairs for each work unit as it
+            completes; error is None on success
+        """
+        units: Dict[Tuple[str, str], List[List[PrivilegeDelta]]] = {}
+        for batch in batches:
+            units.setdefault((batch[0].table, batch[0].ad_group), []).append(batch)
+
+        # Stable sort keeps first-seen order within each action
+        work_units = [
+            sorted(unit, key=lambda batch: batch[0].action != "GRANT")
+            for unit in units.values()
+        ]
+
+        if self.dry_run:
+            # Nothing is executed, so skip rendering and submission entirely
+            for unit in work_units:
+                yield [(delta, None) for batch in unit for delta in batch]
+            return
+
+        if len(work_units) <= 1 or self.max_workers == 1:
+            for unit in work_units:
+                yield self._execute_unit(unit)
+            return
+
+        workers = min(self.max_workers, len(work_units))
+        pending = iter(work_units)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next(in_flight):
+                unit = next(pending, None)
+                if unit is not None:
+                    in_flight.add(executor.submit(self._execute_unit, unit))
+
+            # Keep a bounded window of work units in flight rather than
+            # submitting (and rendering) every statement up front
+            in_flight = set()
+            for _ in range(workers * IN_FLIGHT_PER_WORKER):
+                submit_next(in_flight)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield future.result()
+                    submit_next(in_flight)
+
+    def _execute_unit(
+        self,
+        unit: List[List[PrivilegeDelta]]
+    ) -> List[Tuple[PrivilegeDelta, Optional[str]]]:
+        """
+        Execute the batches of one (table, ad_group) in order.
+
+        Args:
+            unit: Batches sharing table and AD group, GRANTs first
+
+        Returns:
+            List of (delta, error) pairs; error is None on success
+        """
+        results = []
+        for batch in unit:
+            results.extend(self._execute_batch(batch))
+        return results
+
+    def _execute_batch(
+        self,
+        batch: List[PrivilegeDelta]
+    ) -> List[Tuple[PrivilegeDelta, Optional[str]]]:
+        """
+        Execute one batched statement, falling back to single statements.
+
+        UC rejects a multi-privilege statement as a whole if any one
+        privilege is invalid (e.g. MODIFY on a view), so a failed batch is
+        retried one delta at a time and each delta succeeds or fails on
+        its own.
+
+        Args:
+            batch: Deltas sharing action, table and AD group
+
+        Returns:
+            List of (delta, error) pairs; error is None on success
+        """
+        error = self._execute_sql(self._batch_sql(batch))
+
+        if error is None:
+            return [(delta, None) for delta in batch]
+
+        if len(batch) == 1:
+            return [(batch[0], error)]
+
+        return [(delta, self._execute_sql(delta.sql)) for delta in batch]
+
+    def _execute_sql(self, sql: str):
+        """
+        Execute one statement, capturing any failure.
+
+        Args:
+            sql: GRANT or REVOKE statement
+
+        Returns:
+            None if successful, otherwise the error message
+        """
+        try:
+            self.spark.sql(sql)
+            return None
+        except Exception as e:
+            return str(e)
+
     def execute_single_delta(self, delta: PrivilegeDelta) -> bool:
         """
         Execute a single GRANT or REVOKE statement.
@@ -160,15 +369,19 @@ class GrantRevoker:
         """
         Validate that Spark session has permissions to GRANT/REVOKE.
 
-        This is a basic check - attempts a harmless query to verify
-        the session is active and connected to UC.
+        This is a basic check - makes a metadata-only catalog call to
+        verify the session is active and connected to UC. No Spark job
+        is submitted.
 
         Returns:
             True if session appears valid
         """
         try:
-            # Simple query to verify session is active
-            self.spark.sql("SELECT 1").collect()
+            try:
+                self.spark.catalog.currentCatalog()
+            except AttributeError:
+                # currentCatalog() needs Spark 3.4+
+                self.spark.sql("SHOW CATALOGS").limit(1).collect()
             return True
         except Exception:
             return False
@@ -10,18 +10,28 @@ from typing import List
 from enum import Enum
 
 
-class UCPrivilege(Enum):
+class UCPrivilege(str, Enum):
     """
     Unity Catalog table-level privileges.
     
     These are the privileges that NovaFlow manages at the table level.
     Schema and catalog-level privileges are managed by the platform team.
+    
+    Members are also strings, so they compare equal to their SQL keyword
+    (UCPrivilege.SELECT == "SELECT").
     """
     SELECT = "SELECT"
     MODIFY = "MODIFY"
     ALL_PRIVILEGES = "ALL PRIVILEGES"
 
 
+# GRANT/REVOKE statement templates: privilege(s), table, AD group
+PRIVILEGE_SQL_TEMPLATES = {
+    "GRANT": "GRANT {} ON TABLE {} TO `{}`",
+    "REVOKE": "REVOKE {} ON TABLE {} FROM `{}`",
+}
+
+
 @dataclass
 class PrivilegeIntent:
     """
@@ -124,7 +134,7 @@ class ActualPrivilege:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PrivilegeDelta:
     """
     CHANGE needed (GRANT or REVOKE).
@@ -138,6 +148,10 @@ class PrivilegeDelta:
         ad_group: AD group name
         privilege: Privilege to grant or revoke
         reason: Why this change is needed
+        sql: GRANT or REVOKE statement, rendered once at construction
+    
+    Deltas are immutable so the rendered SQL can never drift from the
+    fields it was built from.
     
     Examples:
         # Need to grant (in intent but not actual)
@@ -163,17 +177,19 @@ class PrivilegeDelta:
     ad_group: str
     privilege: UCPrivilege
     reason: str
+    sql: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Validate and normalize data."""
+        """Validate, normalize and render SQL."""
         if isinstance(self.privilege, str):
-            self.privilege = UCPrivilege(self.privilege)
+            object.__setattr__(self, "privilege", UCPrivilege(self.privilege))
         
         if self.action not in ("GRANT", "REVOKE"):
             raise ValueError(f"Invalid action: {self.action}. Must be GRANT or REVOKE")
+        
+        object.__setattr__(self, "sql", self._render_sql())
     
-    @property
-    def sql(self) -> str:
+    def _render_sql(self) -> str:
         """
         Generate SQL statement for this delta.
         
@@ -184,18 +200,9 @@ class PrivilegeDelta:
             GRANT SELECT ON TABLE catalog.schema.table TO `ad_group`
             REVOKE SELECT ON TABLE catalog.schema.table FROM `ad_group`
         """
-        if self.action == "GRANT":
-            return (
-                f"GRANT {self.privilege.value} "
-                f"ON TABLE {self.table} "
-                f"TO `{self.ad_group}`"
-            )
-        else:  # REVOKE
-            return (
-                f"REVOKE {self.privilege.value} "
-                f"ON TABLE {self.table} "
-                f"FROM `{self.ad_group}`"
-            )
+        return PRIVILEGE_SQL_TEMPLATES[self.action].format(
+            self.privilege.value, self.table, self.ad_group
+        )
 
 
 @dataclass
@@ -218,7 +225,9 @@ class AccessControlResult:
         revokes_failed: Number of REVOKEs that failed
         no_change_count: Number of privileges already correct
         execution_time_seconds: Time taken to execute changes
-        errors: List of error messages (if any)
+        errors: Error messages (if any) - the most recent ones when
+            errors_dropped > 0
+        errors_dropped: Number of older error messages not retained
     """
     table: str
     
@@ -240,6 +249,7 @@ class AccessControlResult:
     # Timing and errors
     execution_time_seconds: float
     errors: List[str] = field(default_factory=list)
+    errors_dropped: int = 0
     
     @property
     def is_successful(self) -> bool:
@@ -238,6 +238,8 @@ class StandaloneAccessControlTool:
             
             if result.errors:
                 print(f"\nErrors:")
+                if result.errors_dropped:
+                    print(f"  ({result.errors_dropped} earlier errors not shown)")
                 for error in result.errors:
                     print(f"  - {error}")
         
@@ -4,6 +4,8 @@ Nova Framework Core Module
 Provides configuration management, execution context, and core domain models.
 """
 
+from importlib import import_module
+
 from nova_framework.core.config import (
     FrameworkConfig,
     CatalogConfig,
@@ -13,10 +15,30 @@ from nova_framework.core.config import (
     set_config
 )
 
-from nova_framework.core.context import ExecutionContext, PipelineContext
-
 from nova_framework.core.models import ExecutionStatus, ExecutionResult
 
+# The execution context pulls in the data contract (and pyspark), so it
+# is imported on first access rather than with the package.
+_LAZY_IMPORTS = {
+    "ExecutionContext": "nova_framework.core.context",
+    "PipelineContext": "nova_framework.core.context",
+}
+
+
+def __getattr__(name):
+    """Import heavy components on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 __all__ = [
     # Configuration
     "FrameworkConfig",
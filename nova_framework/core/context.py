@@ -76,6 +76,14 @@ class ExecutionContext:
             table=self.contract.table_name
         )
     
+    @property
+    def write_strategy(self) -> str:
+        """Get write strategy from contract (customProperties.writeStrategy)."""
+        if not self.contract:
+            raise ValueError("Contract not loaded")
+
+        return self.contract.get("customProperties.writeStrategy", "type_2_change_log")
+
     def set_state(self, key: str, value: Any):
         """Store state for use across stages."""
         self.state[key] = value
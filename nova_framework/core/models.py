@@ -8,8 +8,13 @@ from typing import Dict, Any, Optional
 from enum import Enum
 
 
-class ExecutionStatus(Enum):
-    """Pipeline execution status."""
+class ExecutionStatus(str, Enum):
+    """
+    Pipeline execution status.
+    
+    Members are also strings, so they compare equal to and serialize as
+    their values (e.g. ExecutionStatus.SUCCESS == "success").
+    """
     PENDING = "pending"
     RUNNING = "running"
     SUCCESS = "success"
@@ -17,7 +22,7 @@ class ExecutionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """
     Result of a pipeline execution.
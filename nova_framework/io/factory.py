@@ -1,4 +1,6 @@
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Type
 from nova_framework.core.context import ExecutionContext
 from nova_framework.observability.stats import PipelineStats
 from nova_framework.io.readers.base import AbstractReader
@@ -13,6 +15,53 @@ from nova_framework.io.writers.scd4 import SCD4Writer
 from nova_framework.io.writers.file_export import FileExportWriter
 
 
+# Registries are built once at import and are read-only
+_READERS: Mapping[str, Type[AbstractReader]] = MappingProxyType({
+    "file": FileReader,
+    "table": TableReader
+})
+
+_WRITERS: Mapping[str, Type[AbstractWriter]] = MappingProxyType({
+    "overwrite": OverwriteWriter,
+    "append": AppendWriter,
+    "type_2_change_log": T2CLWriter,
+    "scd2": SCD2Writer,
+    "scd4": SCD4Writer,
+    "file_export": FileExportWriter
+})
+
+_READER_NAMES = list(_READERS)
+_WRITER_NAMES = list(_WRITERS)
+
+
+@lru_cache(maxsize=16)
+def _resolve_reader(reader_type: str) -> Type[AbstractReader]:
+    """Resolve reader class for a (case-insensitive) type name."""
+    reader_class = _READERS.get(reader_type.lower())
+
+    if reader_class is None:
+        raise ValueError(
+            f"Unknown reader type: {reader_type}. "
+            f"Available: {_READER_NAMES}"
+        )
+
+    return reader_class
+
+
+@lru_cache(maxsize=16)
+def _resolve_writer(writer_type: str) -> Type[AbstractWriter]:
+    """Resolve writer class for a (case-insensitive) type name."""
+    writer_class = _WRITERS.get(writer_type.lower())
+
+    if writer_class is None:
+        raise ValueError(
+            f"Unknown writer type: {writer_type}. "
+            f"Available: {_WRITER_NAMES}"
+        )
+
+    return writer_class
+
+
 class IOFactory:
     """
     Factory for creating appropriate reader/writer strategies.
@@ -38,20 +87,7 @@ class IOFactory:
         Raises:
             ValueError: If reader_type is unknown
         """
-        readers = {
-            "file": FileReader,
-            "table": TableReader
-        }
-        
-        reader_class = readers.get(reader_type.lower())
-        
-        if reader_class is None:
-            raise ValueError(
-                f"Unknown reader type: {reader_type}. "
-                f"Available: {list(readers.keys())}"
-            )
-        
-        return reader_class(context, pipeline_stats)
+        return _resolve_reader(reader_type)(context, pipeline_stats)
     
     @staticmethod
     def create_writer(
@@ -73,24 +109,7 @@ class IOFactory:
         Raises:
             ValueError: If writer_type is unknown
         """
-        writers = {
-            "overwrite": OverwriteWriter,
-            "append": AppendWriter,
-            "type_2_change_log": T2CLWriter,
-            "scd2": SCD2Writer,
-            "scd4": SCD4Writer,
-            "file_export": FileExportWriter
-        }
-        
-        writer_class = writers.get(writer_type.lower())
-        
-        if writer_class is None:
-            raise ValueError(
-                f"Unknown writer type: {writer_type}. "
-                f"Available: {list(writers.keys())}"
-            )
-        
-        return writer_class(context, pipeline_stats)
+        return _resolve_writer(writer_type)(context, pipeline_stats)
     
     @staticmethod
     def create_writer_from_contract(
@@ -109,7 +128,4 @@ class IOFactory:
         Returns:
             Appropriate writer for contract
         """
-        # Get write strategy from contract
-        write_strategy = context.contract.get("customProperties.writeStrategy", "type_2_change_log")
-        
-        return IOFactory.create_writer(write_strategy, context, pipeline_stats)
\ No newline at end of file
+        return IOFactory.create_writer(context.write_strategy, context, pipeline_stats)
\ No newline at end of file
@@ -41,6 +41,8 @@ class AbstractReader(ABC):
     
     def _log_read_stats(self, total_rows: int, valid_rows: int, invalid_rows: int):
         """Log read statistics to pipeline stats."""
-        self.pipeline_stats.log_stat("rows_read", total_rows)
-        self.pipeline_stats.log_stat("rows_valid", valid_rows)
-        self.pipeline_stats.log_stat("rows_invalid", invalid_rows)
\ No newline at end of file
+        self.pipeline_stats.log_stats({
+            "rows_read": total_rows,
+            "rows_valid": valid_rows,
+            "rows_invalid": invalid_rows
+        })
\ No newline at end of file
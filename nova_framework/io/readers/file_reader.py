@@ -1,8 +1,10 @@
 from pyspark.sql import DataFrame, SparkSession
 from pyspark.sql import functions as F
-from pyspark.sql.types import StructType
-from typing import Dict, Any, Tuple, Optional
+from pyspark.sql.types import StructType, StructField, StringType
+from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
+from functools import reduce
+from operator import and_, or_
 import logging
 
 from nova_framework.io.readers.base import AbstractReader
@@ -11,6 +13,9 @@ from nova_framework.observability.stats import PipelineStats
 
 logger = logging.getLogger(__name__)
 
+# Column Spark fills with the raw text of rows it cannot parse (CSV/JSON)
+CORRUPT_RECORD_COLUMN = "_corrupt_record"
+
 
 class FileReader(AbstractReader):
     """
@@ -21,12 +26,42 @@ class FileReader(AbstractReader):
     
     SUPPORTED_FORMATS = ["parquet", "csv", "json", "delta", "avro", "orc"]
     
+    # Formats that carry their own (typed) schema
+    SELF_DESCRIBING_FORMATS = ("parquet", "delta", "avro", "orc")
+    
+    # Formats with a single table-level schema; these are loaded once and
+    # projected onto the contract schema instead of read twice. File-based
+    # formats are not: without mergeSchema Spark takes their schema from one
+    # file, so a column missing there would be nulled for every file
+    SINGLE_LOAD_FORMATS = ("delta",)
+    
+    # Formats whose columns are validated from the schema-applied data read
+    # rather than a separate schema inference pass
+    DATA_VALIDATED_FORMATS = ("json",)
+    
+    # Quarantine output sizing
+    QUARANTINE_ROWS_PER_FILE = 100_000
+    QUARANTINE_MAX_FILES = 200
+    
     def __init__(self, context: ExecutionContext, pipeline_stats: PipelineStats):
         super().__init__(context, pipeline_stats)
         self.spark = SparkSession.getActiveSession()
         
         if self.spark is None:
             raise RuntimeError("No active Spark session found")
+        
+        # Contract-derived read options are fixed for the reader's lifetime,
+        # so resolve them once rather than on every read
+        self._format_options = {
+            "csv": {
+                **(self.contract.csv_options or {}),
+                "columnNameOfCorruptRecord": CORRUPT_RECORD_COLUMN
+            },
+            "json": {
+                **(getattr(self.contract, 'source_file_json_options', None) or {}),
+                "columnNameOfCorruptRecord": CORRUPT_RECORD_COLUMN
+            }
+        }
     
     def read(
         self,
@@ -65,21 +100,38 @@ class FileReader(AbstractReader):
             logger.info(f"Format: {file_format}")
             logger.info(f"Expected columns: {len(expected_schema.fields)}")
         
-        # Validate schema
-        schema_validation = self._validate_schema(file_path, expected_schema, file_format)
+        raw_df = None
+        if file_format in self.SINGLE_LOAD_FORMATS:
+            raw_df = self.spark.read.format(file_format).load(file_path)
         
-        if schema_validation["has_breaking_changes"] and fail_on_schema_change:
-            raise ValueError(
-                f"Schema breaking changes detected: "
-                f"{schema_validation['missing_columns']}"
-            )
+        # JSON has no header, so inferring its schema up front means parsing
+        # every record before the data read parses them all again. Its
+        # columns are checked from the data read instead (see below).
+        validate_from_data = file_format in self.DATA_VALIDATED_FORMATS
+        
+        # Validate schema
+        schema_validation = None
+        if not validate_from_data:
+            schema_validation = self._validate_schema(file_path, expected_schema, file_format, raw_df)
+            self._check_schema_changes(schema_validation, fail_on_schema_change)
         
         # Read file
-        df = self._read_file(file_path, expected_schema, file_format)
-        total_rows = df.count()
+        if raw_df is not None:
+            df = self._project_to_schema(raw_df, expected_schema, fail_on_schema_change)
+        else:
+            df = self._read_file(file_path, expected_schema, file_format)
         
-        # Separate valid/invalid rows
-        valid_df, invalid_df, row_stats = self._separate_valid_invalid(df, expected_schema)
+        # Separate valid/invalid rows (also yields the total row count)
+        valid_df, invalid_df, row_stats = self._separate_valid_invalid(
+            df, expected_schema, count_columns=validate_from_data
+        )
+        total_rows = row_stats['total_rows']
+        
+        if validate_from_data:
+            schema_validation = self._validate_from_counts(
+                expected_schema, row_stats.pop('non_null_counts'), total_rows
+            )
+            self._check_schema_changes(schema_validation, fail_on_schema_change)
         
         # Log statistics
         self._log_read_stats(total_rows, row_stats['valid_rows'], row_stats['invalid_rows'])
@@ -88,7 +140,9 @@ class FileReader(AbstractReader):
         quarantine_path = None
         if row_stats['invalid_rows'] > 0:
             try:
-                quarantine_path = self._write_quarantine(invalid_df, file_path)
+                quarantine_path = self._write_quarantine(
+                    invalid_df, file_path, row_stats['invalid_rows']
+                )
                 if verbose:
                     logger.info(f"Quarantined {row_stats['invalid_rows']} rows to: {quarantine_path}")
             except Exception as e:
@@ -130,36 +184,58 @@ class FileReader(AbstractReader):
         
         return valid_df, read_report
     
-    def _validate_schema(self, file_path: str, expected_schema: StructType, file_format: str) -> Dict:
+    def _validate_schema(
+        self,
+        file_path: str,
+        expected_schema: StructType,
+        file_format: str,
+        raw_df: Optional[DataFrame] = None
+    ) -> Dict:
         """
         Validate file schema matches expected schema.
         
+        Args:
+            raw_df: Already-loaded frame to take the file schema from
+            
         Returns:
             Dict with validation results
         """
         try:
-            # Read a sample to get actual schema
-            sample_df = self.spark.read.format(file_format).load(file_path).limit(1)
-            actual_schema = sample_df.schema
+            if raw_df is not None:
+                actual_schema = raw_df.schema
+            else:
+                actual_schema = self._probe_schema(file_path, file_format)
             
-            # Get field names
-            expected_fields = {f.name for f in expected_schema.fields}
-            actual_fields = {f.name for f in actual_schema.fields}
+            # Match names the way Spark resolves columns
+            expected_fields = self._field_lookup(expected_schema)
+            actual_fields = self._field_lookup(actual_schema)
             
             # Find differences
-            missing_columns = expected_fields - actual_fields
-            extra_columns = actual_fields - expected_fields
+            missing_columns = [
+                f.name for key, f in expected_fields.items() if key not in actual_fields
+            ]
+            extra_columns = [
+                f.name for key, f in actual_fields.items() if key not in expected_fields
+            ]
             
-            # Check for breaking changes (missing required columns)
-            has_breaking_changes = len(missing_columns) > 0
+            # Types are only meaningful for self-describing formats; CSV
+            # headers carry none and JSON types are inferred
+            type_mismatches = []
+            if file_format in self.SELF_DESCRIBING_FORMATS:
+                type_mismatches = self._type_mismatches(expected_fields, actual_fields)
+            
+            # Check for breaking changes (missing required columns or
+            # columns whose stored type differs from the contract)
+            has_breaking_changes = len(missing_columns) > 0 or len(type_mismatches) > 0
             
             return {
                 "has_breaking_changes": has_breaking_changes,
-                "missing_columns": list(missing_columns),
-                "extra_columns": list(extra_columns),
+                "missing_columns": missing_columns,
+                "extra_columns": extra_columns,
+                "type_mismatches": type_mismatches,
                 "expected_column_count": len(expected_fields),
                 "actual_column_count": len(actual_fields),
-                "schema_match": missing_columns == set() and extra_columns == set()
+                "schema_match": not missing_columns and not extra_columns and not type_mismatches
             }
         
         except Exception as e:
@@ -169,35 +245,170 @@ class FileReader(AbstractReader):
                 "has_breaking_changes": False,
                 "missing_columns": [],
                 "extra_columns": [],
+                "type_mismatches": [],
                 "expected_column_count": len(expected_schema.fields),
                 "actual_column_count": 0,
                 "schema_match": False,
                 "error": str(e)
             }
     
+    def _check_schema_changes(self, schema_validation: Dict, fail_on_schema_change: bool):
+        """Raise if the validation found breaking changes and that is fatal."""
+        if schema_validation["has_breaking_changes"] and fail_on_schema_change:
+            raise ValueError(
+                f"Schema breaking changes detected: "
+                f"missing={schema_validation['missing_columns']}, "
+                f"type_mismatches={schema_validation['type_mismatches']}"
+            )
+    
+    def _validate_from_counts(
+        self,
+        expected_schema: StructType,
+        non_null_counts: Dict[str, int],
+        total_rows: int
+    ) -> Dict:
+        """
+        Validate columns from per-column non-null counts of the data read.
+        
+        With the contract schema applied, a key absent from every record
+        reads as null, so a column with no non-null values is reported as
+        missing (a key present but always null is indistinguishable).
+        Keys outside the contract are dropped by the read, so extra
+        columns cannot be reported. An empty file says nothing about its
+        columns, so none are reported missing.
+        
+        Returns:
+            Dict with validation results, shaped like _validate_schema's
+        """
+        missing_columns = []
+        if total_rows > 0:
+            missing_columns = [
+                f.name for f in expected_schema.fields if non_null_counts.get(f.name, 0) == 0
+            ]
+        
+        return {
+            "has_breaking_changes": len(missing_columns) > 0,
+            "missing_columns": missing_columns,
+            "extra_columns": [],
+            "type_mismatches": [],
+            "expected_column_count": len(expected_schema.fields),
+            "actual_column_count": len(expected_schema.fields) - len(missing_columns),
+            "schema_match": not missing_columns
+        }
+    
+    def _probe_schema(self, file_path: str, file_format: str) -> StructType:
+        """
+        Get the file's own schema without reading its data.
+        
+        The schema is resolved when the reader is loaded. For CSV only the
+        header line is read (column names are all that is compared, so
+        types are never inferred).
+        """
+        reader = self.spark.read.format(file_format)
+        if file_format == "csv":
+            # Same options as the data read (encoding, quote, sep, ...) so
+            # the header is parsed identically, but never infer types
+            reader = reader \
+                .options(**self._format_options["csv"]) \
+                .option("inferSchema", "false")
+        return reader.load(file_path).schema
+    
+    def _field_lookup(self, schema: StructType) -> Dict[str, StructField]:
+        """
+        Index schema fields by name as Spark's resolver compares them.
+        
+        Names are case-insensitive unless spark.sql.caseSensitive is set.
+        """
+        case_sensitive = self.spark.conf.get("spark.sql.caseSensitive", "false").lower() == "true"
+        
+        if case_sensitive:
+            return {f.name: f for f in schema.fields}
+        return {f.name.lower(): f for f in schema.fields}
+    
+    @staticmethod
+    def _type_mismatches(
+        expected_fields: Dict[str, StructField],
+        actual_fields: Dict[str, StructField]
+    ) -> List[Dict[str, str]]:
+        """List columns present in both schemas whose data types differ."""
+        mismatches = []
+        for key, expected in expected_fields.items():
+            actual = actual_fields.get(key)
+            if actual is not None and actual.dataType != expected.dataType:
+                mismatches.append({
+                    "column": expected.name,
+                    "expected_type": expected.dataType.simpleString(),
+                    "actual_type": actual.dataType.simpleString()
+                })
+        return mismatches
+    
+    def _project_to_schema(
+        self,
+        df: DataFrame,
+        schema: StructType,
+        fail_on_schema_change: bool = False
+    ) -> DataFrame:
+        """
+        Project a single-load frame onto the expected schema.
+        
+        Columns are matched by name using Spark's resolver rules, columns
+        missing from the table are added as typed nulls and extra columns
+        are dropped. A column stored with a different type than the
+        contract is cast to the contract type (e.g. int to a long column),
+        as a schema-applied read would; the mismatch itself is reported
+        by _validate_schema.
+        
+        Raises:
+            ValueError: If a column's stored type differs from the contract
+                and fail_on_schema_change is set
+        """
+        expected_fields = self._field_lookup(schema)
+        actual_fields = self._field_lookup(df.schema)
+        
+        mismatches = self._type_mismatches(expected_fields, actual_fields)
+        if mismatches and fail_on_schema_change:
+            raise ValueError(f"Column type mismatches with contract: {mismatches}")
+        
+        columns = []
+        for key, field in expected_fields.items():
+            actual = actual_fields.get(key)
+            if actual is None:
+                col = F.lit(None).cast(field.dataType)
+            else:
+                # Resolve by contract name so Spark applies its own case
+                # rules (and raises on ambiguous names)
+                col = F.col(f"`{field.name}`")
+                if actual.dataType != field.dataType:
+                    col = col.cast(field.dataType)
+            columns.append(col.alias(field.name))
+        
+        return df.select(*columns)
+    
     def _read_file(self, file_path: str, schema: StructType, file_format: str) -> DataFrame:
         """Read file with schema applied."""
+        options = self._format_options.get(file_format)
+        
+        # Spark only populates the corrupt record column if it is part of
+        # the read schema, so malformed rows are split out during the parse
+        if options and CORRUPT_RECORD_COLUMN not in schema.fieldNames():
+            schema = StructType(
+                schema.fields + [StructField(CORRUPT_RECORD_COLUMN, StringType(), True)]
+            )
+        
         reader = self.spark.read.format(file_format).schema(schema)
         
         # Apply format-specific options
-        if file_format == "csv":
-            csv_options = self.contract.csv_options or {}
-            for key, value in csv_options.items():
-                reader = reader.option(key, value)
-            reader = reader.option("columnNameOfCorruptRecord", "_corrupt_record")
-        elif file_format == "json":
-            json_options = getattr(self.contract, 'source_file_json_options', None) or {}
-            for key, value in json_options.items():
-                reader = reader.option(key, value)
-            reader = reader.option("columnNameOfCorruptRecord", "_corrupt_record")
+        if options:
+            reader = reader.options(**options)
         
         return reader.load(file_path)
     
     def _separate_valid_invalid(
         self, 
         df: DataFrame, 
-        expected_schema: StructType
-    ) -> Tuple[DataFrame, DataFrame, Dict[str, int]]:
+        expected_schema: StructType,
+        count_columns: bool = False
+    ) -> Tuple[DataFrame, DataFrame, Dict[str, Any]]:
         """
         Separate valid and invalid rows.
         
@@ -205,65 +416,87 @@ class FileReader(AbstractReader):
         - Corrupt records (if CSV/JSON)
         - All null values
         
+        Args:
+            count_columns: Also count non-null values per data column in
+                the same job, returned as stats['non_null_counts']
+        
         Returns:
             (valid_df, invalid_df, stats_dict)
         """
-        total_count = df.count()
-        
         # Check if corrupt record column exists
-        has_corrupt_column = "_corrupt_record" in df.columns
+        has_corrupt_column = CORRUPT_RECORD_COLUMN in df.columns
         
+        # Additional check: rows where ALL data columns are null are invalid
+        data_columns = [f.name for f in expected_schema.fields if f.name in df.columns]
+        
+        # The valid predicate is built positively from IsNotNull terms on
+        # source columns, so Spark can push it into the file scan as-is
+        conditions = []
         if has_corrupt_column:
-            # Separate based on corrupt record column
-            valid_df = df.filter(F.col("_corrupt_record").isNull()).drop("_corrupt_record")
-            invalid_df = df.filter(F.col("_corrupt_record").isNotNull())
+            conditions.append(F.col(CORRUPT_RECORD_COLUMN).isNull())
+        if data_columns:
+            conditions.append(reduce(or_, [F.col(c).isNotNull() for c in data_columns]))
+        
+        if conditions:
+            is_valid = reduce(and_, conditions)
+            valid_df = df.filter(is_valid)
+            invalid_df = df.filter(~is_valid)
+            is_invalid = ~is_valid
         else:
-            # No corrupt records - all rows are valid
             valid_df = df
-            invalid_df = self.spark.createDataFrame([], df.schema)
-        
-        # Additional check: filter out rows where ALL data columns are null
-        data_columns = [f.name for f in expected_schema.fields]
-        
-        # Create condition for at least one non-null column
-        non_null_condition = None
-        for col_name in data_columns:
-            if col_name in valid_df.columns:
-                if non_null_condition is None:
-                    non_null_condition = F.col(col_name).isNotNull()
-                else:
-                    non_null_condition = non_null_condition | F.col(col_name).isNotNull()
-        
-        if non_null_condition is not None:
-            all_null_df = valid_df.filter(~non_null_condition)
-            valid_df = valid_df.filter(non_null_condition)
-            
-            # Combine with corrupt records for quarantine
-            if all_null_df.count() > 0:
-                invalid_df = invalid_df.union(all_null_df.select(invalid_df.columns))
+            invalid_df = df.limit(0)
+            is_invalid = F.lit(False)
+        
+        if has_corrupt_column:
+            valid_df = valid_df.drop(CORRUPT_RECORD_COLUMN)
         
-        # Count results
-        valid_count = valid_df.count()
-        invalid_count = total_count - valid_count
+        # Count both partitions in a single job rather than one per count()
+        aggregates = [
+            F.count(F.lit(1)).alias("total_rows"),
+            F.count(F.when(is_invalid, 1)).alias("invalid_rows")
+        ]
+        if count_columns:
+            aggregates += [F.count(F.col(c)) for c in data_columns]
+        
+        counts = df.agg(*aggregates).first()
+        
+        total_count = counts[0]
+        invalid_count = counts[1]
         
         stats = {
-            "valid_rows": valid_count,
+            "total_rows": total_count,
+            "valid_rows": total_count - invalid_count,
             "invalid_rows": invalid_count
         }
         
+        if count_columns:
+            stats["non_null_counts"] = dict(zip(data_columns, counts[2:]))
+        
         return valid_df, invalid_df, stats
     
-    def _write_quarantine(self, invalid_df: DataFrame, source_path: str) -> str:
+    def _write_quarantine(self, invalid_df: DataFrame, source_path: str, row_count: int) -> str:
         """Write invalid rows to quarantine location."""
         try:
             quarantine_path = self.context.quarantine_path
             
+            # Invalid rows are usually sparse across the source partitions;
+            # size the output to the row count to avoid many tiny files.
+            # repartition (not coalesce) so the source scan keeps its
+            # parallelism and only the invalid rows are shuffled. AQE leaves
+            # an explicit partition count as is, so the file count does not
+            # depend on session settings.
+            num_files = max(1, min(self.QUARANTINE_MAX_FILES, row_count // self.QUARANTINE_ROWS_PER_FILE + 1))
+            
             # Add quarantine metadata
             invalid_df_with_meta = invalid_df \
+                .repartition(num_files) \
                 .withColumn("quarantine_timestamp", F.current_timestamp()) \
                 .withColumn("source_file", F.lit(source_path)) \
                 .withColumn("process_queue_id", F.lit(self.context.process_queue_id))
             
+            # mergeSchema stays on: quarantine rows from CSV/JSON carry the
+            # corrupt record column and rows from other formats do not, so the
+            # table's schema legitimately changes between writes
             invalid_df_with_meta.write \
                 .format("delta") \
                 .mode("append") \
@@ -1,8 +1,11 @@
 from pyspark.sql import DataFrame, SparkSession
 from typing import Dict, Any, Tuple, Optional
+import logging
 
 from nova_framework.io.readers.base import AbstractReader
 
+logger = logging.getLogger(__name__)
+
 
 class TableReader(AbstractReader):
     """
@@ -16,7 +19,8 @@ class TableReader(AbstractReader):
         table_name: Optional[str] = None,
         filter_condition: Optional[str] = None,
         columns: Optional[list] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        row_count_mode: str = "exact"
     ) -> Tuple[DataFrame, Dict[str, Any]]:
         """
         Read from Delta table.
@@ -26,10 +30,18 @@ class TableReader(AbstractReader):
             filter_condition: SQL WHERE clause to filter data
             columns: List of columns to select (None = all)
             verbose: Print progress messages
+            row_count_mode: "exact" to count rows read, "skip" to leave the
+                count out of the report (avoids a Spark job on large reads)
             
         Returns:
             Tuple of (dataframe, read_report)
         """
+        if row_count_mode not in ("exact", "skip"):
+            raise ValueError(
+                f"Unknown row_count_mode: {row_count_mode}. "
+                f"Available: ['exact', 'skip']"
+            )
+        
         self.spark = SparkSession.getActiveSession()
         
         # Build table name
@@ -48,8 +60,10 @@ class TableReader(AbstractReader):
             df = df.select(*columns)
         
         # Count rows
-        row_count = df.count()
-        self.pipeline_stats.log_stat("rows_read", row_count)
+        row_count = None
+        if row_count_mode == "exact":
+            row_count = df.count()
+            self.pipeline_stats.log_stat("rows_read", row_count)
         
         # Build report
         read_report = {
@@ -61,6 +75,9 @@ class TableReader(AbstractReader):
         }
         
         if verbose:
-            logger.info(f"Read {row_count:,} rows from {table_name}")
+            if row_count is None:
+                logger.info(f"Read from {table_name} (row count skipped)")
+            else:
+                logger.info(f"Read {row_count:,} rows from {table_name}")
         
         return df, read_report
\ No newline at end of file
@@ -20,7 +20,9 @@ class AppendWriter(AbstractWriter):
         target_table: Optional[str] = None,
         partition_cols: Optional[list] = None,
         deduplicate: bool = False,
-        dedup_cols: Optional[list] = None
+        dedup_cols: Optional[list] = None,
+        optimize: bool = False,
+        zorder_cols: Optional[list] = None
     ) -> Dict[str, Any]:
         """
         Append data to target table.
@@ -31,6 +33,8 @@ class AppendWriter(AbstractWriter):
             partition_cols: Columns to partition by
             deduplicate: Remove duplicates before appending
             dedup_cols: Columns to use for deduplication
+            optimize: Run OPTIMIZE after write to compact small files
+            zorder_cols: Columns to Z-ORDER by when optimizing
             
         Returns:
             Dictionary with write statistics
@@ -44,21 +48,29 @@ class AppendWriter(AbstractWriter):
                 df = df.dropDuplicates(dedup_cols)
             else:
                 df = df.dropDuplicates()
-            
-            dedup_count = original_count - df.count()
-            logger.info(f"Removed {dedup_count:,} duplicate rows")
-            self.pipeline_stats.log_stat("rows_deduped", dedup_count)
         
-        row_count = df.count()
-        logger.info(f"Appending {row_count:,} rows to {target}")
+        logger.info(f"Appending to {target}")
         
         # Write
-        writer = df.write.format("delta").mode("append")
+        # Rows written come from this write's own commit metrics rather than
+        # counting the (deduplicated) input again, so concurrent appends
+        # cannot skew the dedup count below
+        row_count = self._save_as_table(df, target, "append", partition_cols)
+        logger.info(f"Appended {row_count:,} rows to {target}")
         
-        if partition_cols:
-            writer = writer.partitionBy(*partition_cols)
+        if deduplicate:
+            dedup_count = original_count - row_count
+            logger.info(f"Removed {dedup_count:,} duplicate rows")
+            self.pipeline_stats.log_stat("rows_deduped", dedup_count)
         
-        writer.saveAsTable(target)
+        # Optimize
+        if optimize:
+            optimize_sql = f"OPTIMIZE {target}"
+            if zorder_cols:
+                zorder = ", ".join(f"`{c}`" for c in zorder_cols)
+                optimize_sql += f" ZORDER BY ({zorder})"
+            self.spark.sql(optimize_sql)
+            logger.info(f"Optimized {target}")
         
         # Log stats
         self._log_write_stats(row_count, "append")
@@ -68,5 +80,6 @@ class AppendWriter(AbstractWriter):
             "target_table": target,
             "rows_written": row_count,
             "deduplicated": deduplicate,
+            "optimized": optimize,
             "dedup_removed": dedup_count if deduplicate else 0
         }
\ No newline at end of file
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
-from pyspark.sql import DataFrame, SparkSession
-from typing import Dict, Any, Optional
+from pyspark.sql import DataFrame, DataFrameWriter, SparkSession
+from pyspark.sql import functions as F
+from typing import Dict, Any, List, Optional
+import logging
+import uuid
 from nova_framework.core.context import ExecutionContext
 from nova_framework.observability.stats import PipelineStats
 
+logger = logging.getLogger(__name__)
+
 
 class AbstractWriter(ABC):
     """
@@ -12,6 +17,14 @@ class AbstractWriter(ABC):
     All concrete writers must implement the write() method.
     """
     
+    # Delta history operations recorded for DataFrame writes
+    WRITE_OPERATIONS = frozenset({
+        "WRITE",
+        "CREATE TABLE AS SELECT",
+        "REPLACE TABLE AS SELECT",
+        "CREATE OR REPLACE TABLE AS SELECT"
+    })
+    
     def __init__(self, context: ExecutionContext, pipeline_stats: PipelineStats):
         """
         Initialize writer with context.
@@ -53,6 +66,128 @@ class AbstractWriter(ABC):
         
         return f"{self.catalog}.{self.contract.schema_name}.{self.contract.table_name}"
     
+    def _delta_writer(
+        self,
+        df: DataFrame,
+        mode: str,
+        partition_cols: Optional[List[str]] = None,
+        options: Optional[Dict[str, str]] = None
+    ) -> DataFrameWriter:
+        """
+        Build a Delta DataFrameWriter.
+        
+        Shared construction for the writers, so format, mode, options and
+        partitioning are set up the same way for every write.
+        
+        Args:
+            df: DataFrame to write
+            mode: Save mode ('append', 'overwrite')
+            partition_cols: Columns to partition by
+            options: Delta writer options (e.g. mergeSchema)
+            
+        Returns:
+            Configured writer; call saveAsTable() to write
+        """
+        writer = df.write.format("delta").mode(mode)
+        
+        if options:
+            writer = writer.options(**options)
+        
+        if partition_cols:
+            writer = writer.partitionBy(*partition_cols)
+        
+        return writer
+    
+    def _save_as_table(
+        self,
+        df: DataFrame,
+        target: str,
+        mode: str,
+        partition_cols: Optional[List[str]] = None,
+        options: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        Write to a Delta table and return the rows written by that commit.
+        
+        The commit is pinned by the table version before the write plus a
+        unique userMetadata tag, so concurrent writers or auto-compaction
+        commits cannot be mistaken for this write.
+        
+        Args:
+            df: DataFrame to write
+            target: Fully qualified table name
+            mode: Save mode ('append', 'overwrite')
+            partition_cols: Columns to partition by
+            options: Additional Delta writer options
+            
+        Returns:
+            Number of rows written
+        """
+        version_before = self._table_version(target)
+        commit_tag = f"nova:{self.context.process_queue_id}:{uuid.uuid4().hex}"
+        
+        self._delta_writer(
+            df, mode, partition_cols, {**(options or {}), "userMetadata": commit_tag}
+        ).saveAsTable(target)
+        
+        return self._rows_written(target, df, version_before, commit_tag)
+    
+    def _table_version(self, target: str) -> int:
+        """
+        Get the current Delta version of a table.
+        
+        Returns -1 if the table does not exist or its history cannot be
+        read; the commit tag alone still identifies the write in that case.
+        """
+        if not self.spark.catalog.tableExists(target):
+            return -1
+        
+        try:
+            return self.spark.sql(f"DESCRIBE HISTORY {target} LIMIT 1").first()["version"]
+        except Exception as e:
+            logger.warning(f"Could not read Delta version of {target}: {e}")
+            return -1
+    
+    def _rows_written(
+        self,
+        target: str,
+        df: DataFrame,
+        version_before: int,
+        commit_tag: str
+    ) -> int:
+        """
+        Get rows written by a specific commit to a Delta table.
+        
+        Reads numOutputRows from the commit's metrics in the transaction log
+        rather than scanning data. Only commits after version_before that
+        carry commit_tag and are a write operation are considered; if the
+        commit or its metrics cannot be found, the DataFrame is counted.
+        """
+        try:
+            commits = self.spark.sql(f"DESCRIBE HISTORY {target}") \
+                .filter(
+                    (F.col("version") > version_before)
+                    & (F.col("userMetadata") == commit_tag)
+                ) \
+                .select("version", "operation", "operationMetrics") \
+                .collect()
+            
+            for commit in commits:
+                metrics = commit["operationMetrics"] or {}
+                if commit["operation"] in self.WRITE_OPERATIONS and "numOutputRows" in metrics:
+                    return int(metrics["numOutputRows"])
+            
+            logger.warning(
+                f"No write commit metrics found for {target} after version "
+                f"{version_before}; counting rows instead"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not read commit metrics for {target}: {e}; counting rows instead"
+            )
+        
+        return df.count()
+    
     def _log_write_stats(self, rows_written: int, strategy: str):
         """Log write statistics."""
         self.pipeline_stats.log_stat("rows_written", rows_written)
@@ -34,22 +34,20 @@ class OverwriteWriter(AbstractWriter):
             Dictionary with write statistics
         """
         target = self._get_target_table(target_table)
-        row_count = df.count()
         
-        logger.info(f"Overwriting {row_count:,} rows to {target}")
+        logger.info(f"Overwriting {target}")
         
         # Write
-        writer = df.write.format("delta").mode("overwrite")
-        
-        if partition_cols:
-            writer = writer.partitionBy(*partition_cols)
-        elif self.contract.natural_key_columns:
+        if not partition_cols and self.contract.natural_key_columns:
             # Use natural keys for partitioning if specified
             partition_col = "partition_key"
             if partition_col in df.columns:
-                writer = writer.partitionBy(partition_col)
+                partition_cols = [partition_col]
         
-        writer.saveAsTable(target)
+        # Row count comes from the commit metrics, so the source is not
+        # scanned a second time just to count it
+        row_count = self._save_as_table(df, target, "overwrite", partition_cols)
+        logger.info(f"Overwrote {row_count:,} rows to {target}")
         
         # Optimize
         if optimize:
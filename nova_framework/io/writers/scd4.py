@@ -78,10 +78,7 @@ class SCD4Writer(AbstractWriter):
         # Overwrite current table
         current_count = current_df.count()
         
-        current_df.write \
-            .format("delta") \
-            .mode("overwrite") \
-            .saveAsTable(current_table)
+        self._delta_writer(current_df, "overwrite").saveAsTable(current_table)
         
         logger.info(f"Current table updated: {current_count:,} rows")
         
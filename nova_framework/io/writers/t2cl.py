@@ -115,12 +115,9 @@ class T2CLWriter(AbstractWriter):
 
         # First load - create table
         if not self.spark.catalog.tableExists(target):
-            incoming_prepared.write \
-                .format("delta") \
-                .mode("overwrite") \
-                .option("mergeSchema", "true") \
-                .partitionBy(partition_col) \
-                .saveAsTable(target)
+            self._delta_writer(
+                incoming_prepared, "overwrite", [partition_col], {"mergeSchema": "true"}
+            ).saveAsTable(target)
 
             row_count = incoming_prepared.count()
             self._log_write_stats(row_count, "t2cl_first_load")
@@ -226,12 +223,9 @@ class T2CLWriter(AbstractWriter):
         logger.info(f"About to insert: new={new_count}, changed={changed_count}, deleted={deleted_count}, total={total_inserted}")
 
         if total_inserted > 0:
-            to_insert.write \
-                .format("delta") \
-                .mode("append") \
-                .option("mergeSchema", "true") \
-                .partitionBy(partition_col) \
-                .saveAsTable(target)
+            self._delta_writer(
+                to_insert, "append", [partition_col], {"mergeSchema": "true"}
+            ).saveAsTable(target)
 
         self._log_write_stats(total_inserted, "type_2_change_log")
         self.pipeline_stats.log_stat("t2cl_new", new_count)
@@ -103,6 +103,18 @@ class PipelineStats:
         """
         self.custom_stats[key] = value
     
+    def log_stats(self, stats: Dict[str, Any]):
+        """
+        Log several custom statistics at once.
+        
+        Args:
+            stats: Mapping of statistic name to value
+            
+        Example:
+            stats.log_stats({"rows_valid": 95, "rows_invalid": 5})
+        """
+        self.custom_stats.update(stats)
+    
     def increment_stat(self, key: str, amount: int = 1):
         """
         Increment a counter statistic.
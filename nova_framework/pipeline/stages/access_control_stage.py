@@ -182,7 +182,13 @@ class AccessControlStage(AbstractStage):
             )
             
             if result.errors:
-                self.logger.warning(f"Encountered {len(result.errors)} errors")
+                self.logger.warning(
+                    f"Encountered {len(result.errors) + result.errors_dropped} errors"
+                )
+                if result.errors_dropped:
+                    self.logger.warning(
+                        f"  ({result.errors_dropped} earlier errors not shown)"
+                    )
                 for error in result.errors:
                     self.logger.warning(f"  {error}")
             
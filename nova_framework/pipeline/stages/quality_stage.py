@@ -103,10 +103,11 @@ class QualityStage(AbstractStage):
                 f"{failed_rows} failed ({failed_pct:.2f}%)"
             )
             
-            # Write DQ errors if any
-            error_count = df_dq_errors.count()
-            if error_count > 0:
-                self.logger.warning(f"Writing {error_count} DQ errors to violations table")
+            # Write DQ errors if any (failed_rows avoids a separate count job)
+            if failed_rows > 0:
+                self.logger.warning(
+                    f"Writing DQ errors for {failed_rows} rows to violations table"
+                )
                 self._write_dq_errors(df_dq_errors)
             else:
                 self.logger.info("No DQ errors detected")
@@ -7,6 +7,7 @@ Provides data cleansing and validation capabilities for pipeline processing.
 - Validation rules annotate data without modifying original values
 """
 
+from functools import reduce
 from pyspark.sql import DataFrame
 from pyspark.sql import functions as F
 from pyspark.sql import Window
@@ -14,6 +15,26 @@ from nova_framework.observability import get_logger
 
 logger = get_logger("quality.dqengine")
 
+# Truthy/falsy forms recognised by clean_normalize_boolean_values
+_BOOL_TRUE = ("1", "t", "true", "yes", "y")
+_BOOL_FALSE = ("0", "f", "false", "no", "n")
+
+# Cleansing rules where applying the rule twice equals applying it once
+_IDEMPOTENT_CLEANSING_RULES = frozenset({
+    "trim", "upper", "lower", "nullify_empty_strings", "normalize_boolean_values"
+})
+
+# Numeric string accepted by _safe_cast_to_double / rule_is_number
+_NUMBER_PATTERN = "^[+-]?([0-9]*[.])?[0-9]+$"
+
+# Columns added by DQEngine.apply_dq
+DQ_COLUMNS = ("_dq_failures", "_dq_fail_weight", "dq_score", "_dq_error")
+
+
+def _uniqueness_count_col(rule_type, cols):
+    """Name of the precomputed window-count column for a uniqueness rule."""
+    return f"_dq_cnt_{rule_type}__{'__'.join(cols)}"
+
 
 class DQEngine:
     """
@@ -35,10 +56,19 @@ class DQEngine:
         summary, df_quality, df_errors = engine.apply_dq(df_clean, quality_rules)
     """
 
+    # Rule name -> handler method name, built once per class (see _build_handlers)
+    _CLEAN_HANDLERS = {}
+    _DQ_HANDLERS = {}
+
     def __init__(self):
         """Initialize DQ Engine."""
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild handler tables so subclasses can add or override rules."""
+        super().__init_subclass__(**kwargs)
+        _build_handlers(cls)
+
     # =========================================================================
     # HELPERS
     # =========================================================================
@@ -53,12 +83,24 @@ class DQEngine:
         Returns:
             Double value or None for non-numeric values
         """
-        cleaned = F.regexp_replace(F.col(col), "[^0-9.+-]", "")
+        cleaned = self._numeric_chars(col)
         return F.when(
-            cleaned.rlike("^[+-]?([0-9]*[.])?[0-9]+$"),
+            cleaned.rlike(_NUMBER_PATTERN),
             cleaned.cast("double")
         ).otherwise(F.lit(None))
 
+    def _numeric_chars(self, col):
+        """
+        Strip everything except digits, sign and decimal point.
+        
+        Args:
+            col: Column name
+            
+        Returns:
+            String expression with non-numeric characters removed
+        """
+        return F.regexp_replace(F.col(col), "[^0-9.+-]", "")
+
     # =========================================================================
     # CLEANSING (TRANSFORMATIONS)
     # =========================================================================
@@ -121,7 +163,9 @@ class DQEngine:
         
         Args:
             df: Input DataFrame
-            rule: Dict with 'column', 'pattern', and optional 'replacement'
+            rule: Dict with 'column', 'pattern', and optional 'replacement',
+                or 'column' and 'replacements' (list of (pattern, replacement)
+                pairs applied in order, as produced by _fuse_regex_rules)
             
         Returns:
             DataFrame with replaced values
@@ -130,11 +174,16 @@ class DQEngine:
         if not col:
             logger.warning("clean_regex_replace: missing 'column' in rule")
             return df
-            
-        return df.withColumn(
-            col,
-            F.regexp_replace(F.col(col), rule["pattern"], rule.get("replacement", ""))
-        )
+
+        replacements = rule.get("replacements") or [
+            (rule["pattern"], rule.get("replacement", ""))
+        ]
+
+        expr = F.col(col)
+        for pattern, replacement in replacements:
+            expr = F.regexp_replace(expr, pattern, replacement)
+
+        return df.withColumn(col, expr)
 
     def clean_nullify_empty_strings(self, df, rule):
         """
@@ -162,24 +211,27 @@ class DQEngine:
         
         Args:
             df: Input DataFrame
-            rule: Dict with 'column' key
+            rule: Dict with 'column' (str) or 'columns' (list) key
             
         Returns:
             DataFrame with normalized boolean values
         """
-        col = rule.get("column")
-        if not col:
+        cols = [c for c in (rule.get("columns") or [rule.get("column")]) if c]
+        if not cols:
             logger.warning("clean_normalize_boolean_values: missing 'column' in rule")
             return df
             
-        logger.debug(f"Normalizing boolean values for column: {col}")
-        
-        return df.withColumn(
-            col,
-            F.when(F.lower(F.col(col)).isin("1", "t", "true", "yes", "y"), "True")
-             .when(F.lower(F.col(col)).isin("0", "f", "false", "no", "n"), "False")
-             .otherwise(F.col(col))
-        )
+        for col in cols:
+            logger.debug(f"Normalizing boolean values for column: {col}")
+            
+            lowered = F.lower(F.col(col))
+            df = df.withColumn(
+                col,
+                F.when(lowered.isin(*_BOOL_TRUE), "True")
+                 .when(lowered.isin(*_BOOL_FALSE), "False")
+                 .otherwise(F.col(col))
+            )
+        return df
 
     # =========================================================================
     # EVALUATION RULES
@@ -313,7 +365,9 @@ class DQEngine:
             Boolean expression (True = failure)
         """
         col = rule["column"]
-        return self._safe_cast_to_double(col).isNull() & F.col(col).isNotNull()
+        # Same outcome as _safe_cast_to_double(col).isNull(), without the
+        # cast: a value is a number exactly when its cleaned form matches
+        return F.col(col).isNotNull() & ~self._numeric_chars(col).rlike(_NUMBER_PATTERN)
 
     def rule_min(self, df, rule):
         """
@@ -357,9 +411,10 @@ class DQEngine:
             Boolean expression (True = failure)
         """
         col = rule["column"]
+        value = self._safe_cast_to_double(col)
         return ~(
-            (self._safe_cast_to_double(col) >= F.lit(rule["min"])) &
-            (self._safe_cast_to_double(col) <= F.lit(rule["max"]))
+            (value >= F.lit(rule["min"])) &
+            (value <= F.lit(rule["max"]))
         )
 
     def rule_conditional(self, df, rule):
@@ -403,6 +458,9 @@ class DQEngine:
             Boolean expression (True = failure)
         """
         col = rule["column"]
+        count_col = _uniqueness_count_col("unique", [col])
+        if count_col in df.columns:
+            return F.col(count_col) > 1
         return F.count(F.col(col)).over(Window.partitionBy(col)) > 1
 
     def rule_composite_unique(self, df, rule):
@@ -417,6 +475,9 @@ class DQEngine:
             Boolean expression (True = failure)
         """
         cols = rule["columns"]
+        count_col = _uniqueness_count_col("composite_unique", cols)
+        if count_col in df.columns:
+            return F.col(count_col) > 1
         return (
             F.count(F.lit(1)).over(Window.partitionBy(*cols)) > 1
         )
@@ -425,6 +486,130 @@ class DQEngine:
     # DQ EXECUTION
     # =========================================================================
 
+    def _add_uniqueness_counts(self, df, rules):
+        """
+        Precompute window counts for all uniqueness rules in one projection.
+        
+        Each distinct partition key is computed once, however many rules
+        reference it, and all windows are added in a single select so
+        Spark can share Window operators between rules. rule_unique and
+        rule_composite_unique pick up these columns when present.
+        
+        Args:
+            df: Input DataFrame
+            rules: List of validation rule dicts
+            
+        Returns:
+            DataFrame with one _dq_cnt_* column per distinct key
+        """
+        counts = {}
+        for r in rules:
+            try:
+                if r["rule"] == "unique":
+                    cols = [r["column"]]
+                    counts.setdefault(
+                        _uniqueness_count_col("unique", cols),
+                        F.count(F.col(cols[0])).over(Window.partitionBy(*cols))
+                    )
+                elif r["rule"] == "composite_unique":
+                    cols = r["columns"]
+                    counts.setdefault(
+                        _uniqueness_count_col("composite_unique", cols),
+                        F.count(F.lit(1)).over(Window.partitionBy(*cols))
+                    )
+            except KeyError:
+                # Malformed rule - reported when the rule itself is evaluated
+                continue
+
+        if not counts:
+            return df
+
+        return df.select("*", *[expr.alias(name) for name, expr in counts.items()])
+
+    def _dedupe_cleansing_rules(self, rules):
+        """
+        Drop idempotent cleansing rules that would be no-ops.
+        
+        A trim/upper/lower/nullify_empty_strings/normalize_boolean_values
+        rule is dropped for a column when the previous rule applied to
+        that column was the same rule, since applying it again cannot
+        change the value. Rule order is otherwise preserved; anything
+        else touching the column in between (e.g. a regex_replace) keeps
+        the later rule.
+        
+        Args:
+            rules: List of cleansing rule dicts
+            
+        Returns:
+            List of cleansing rule dicts (never longer than the input)
+        """
+        last_rule = {}  # column -> rule type last applied to it
+        deduped = []
+
+        for r in rules:
+            rtype = r.get("rule")
+            cols = [c for c in (r.get("columns") or [r.get("column")]) if c]
+
+            if rtype not in _IDEMPOTENT_CLEANSING_RULES:
+                deduped.append(r)
+                for col in cols:
+                    last_rule[col] = None
+                continue
+
+            remaining = [c for c in cols if last_rule.get(c) != rtype]
+            for col in remaining:
+                last_rule[col] = rtype
+
+            if len(remaining) == len(cols):
+                deduped.append(r)
+            elif remaining:
+                trimmed = {k: v for k, v in r.items() if k != "column"}
+                trimmed["columns"] = remaining
+                deduped.append(trimmed)
+            else:
+                logger.debug(f"Dropping redundant cleansing rule: {r}")
+
+        return deduped
+
+    def _fuse_regex_rules(self, rules):
+        """
+        Merge consecutive regex_replace rules on the same column.
+        
+        The merged rule carries an ordered 'replacements' list, so
+        clean_regex_replace emits one nested regexp_replace expression
+        and a single projection instead of one withColumn per rule.
+        Replacements still run in their original order, so results are
+        unchanged.
+        
+        Args:
+            rules: List of cleansing rule dicts
+            
+        Returns:
+            List of cleansing rule dicts (never longer than the input)
+        """
+        fused = []
+        current = None  # last merged rule, still open for appending
+
+        for r in rules:
+            if r.get("rule") != "regex_replace" or "pattern" not in r:
+                fused.append(r)
+                current = None
+                continue
+
+            pair = (r["pattern"], r.get("replacement", ""))
+
+            if current is not None and current["column"] == r.get("column"):
+                current["replacements"].append(pair)
+            else:
+                current = {
+                    "rule": "regex_replace",
+                    "column": r.get("column"),
+                    "replacements": [pair]
+                }
+                fused.append(current)
+
+        return fused
+
     def apply_cleansing(self, df, rules):
         """
         Apply cleansing rules to DataFrame.
@@ -443,11 +628,13 @@ class DQEngine:
             ]
             df_clean = engine.apply_cleansing(df, rules)
         """
-        for r in rules:
+        rules = self._dedupe_cleansing_rules(rules)
+
+        for r in self._fuse_regex_rules(rules):
             try:
-                handler = getattr(self, f"clean_{r['rule']}", None)
+                handler = self._CLEAN_HANDLERS.get(r["rule"])
                 if handler:
-                    df = handler(df, r)
+                    df = getattr(self, handler)(df, r)
                 else:
                     logger.warning(f"Unknown cleansing rule: {r['rule']}")
             except Exception as e:
@@ -476,21 +663,24 @@ class DQEngine:
             ]
             summary, df_quality, df_errors = engine.apply_dq(df, rules)
         """
-        annotated = df
         failure_structs = []
+        weight_exprs = []
         total_weight = 0
 
+        # Shared window counts for unique/composite_unique rules
+        evaluated = self._add_uniqueness_counts(df, rules)
+
         # ---------------------------------------------------------
         # 1. Evaluate each rule into a boolean expression
         # ---------------------------------------------------------
         for r in rules:
             try:
-                handler = getattr(self, f"rule_{r['rule']}", None)
+                handler = self._DQ_HANDLERS.get(r["rule"])
                 if handler is None:
                     logger.warning(f"Unknown validation rule: {r['rule']}")
                     continue
 
-                expr = handler(annotated, r)  # boolean expr indicating failure
+                expr = getattr(self, handler)(evaluated, r)  # boolean expr indicating failure
                 weight = r.get("weight", 1)
                 total_weight += weight
 
@@ -504,57 +694,45 @@ class DQEngine:
                         )
                     )
                 )
+                weight_exprs.append(F.when(expr, F.lit(weight)).otherwise(F.lit(0)))
             except Exception as e:
                 logger.error(f"Validation rule {r['rule']} failed: {str(e)}")
                 # Continue with other rules
                 continue
 
         # ---------------------------------------------------------
-        # 2. Always create _dq_failures column
-        #    Empty array if no rules exist
+        # 2. Build the DQ column expressions
+        #    _dq_failures is always present (empty array if no rules);
+        #    the fail weight is summed directly from the rule
+        #    expressions rather than re-aggregated from the array
         # ---------------------------------------------------------
         if failure_structs:
-            annotated = annotated.withColumn("_dq_failures", F.array(*failure_structs))
-            annotated = annotated.withColumn(
-                "_dq_failures",
-                F.expr("filter(_dq_failures, x -> x is not null)")
-            )
+            failures_col = F.filter(F.array(*failure_structs), lambda x: x.isNotNull())
+            fail_weight_col = reduce(lambda acc, w: acc + w, weight_exprs)
         else:
             # explicit empty array<struct<...>>
-            annotated = annotated.withColumn(
-                "_dq_failures",
-                F.array().cast(
-                    "array<struct<rule:string,column:string,weight:int,failed_value:string>>"
-                )
+            failures_col = F.array().cast(
+                "array<struct<rule:string,column:string,weight:int,failed_value:string>>"
             )
+            fail_weight_col = F.lit(0)
 
-        # ---------------------------------------------------------
-        # 3. Always create _dq_fail_weight
-        # ---------------------------------------------------------
-        annotated = annotated.withColumn(
-            "_dq_fail_weight",
-            F.expr("aggregate(_dq_failures, 0, (acc, x) -> acc + x.weight)")
-        )
-
-        # ---------------------------------------------------------
-        # 4. Always create dq_score
-        # ---------------------------------------------------------
         if total_weight > 0:
-            annotated = annotated.withColumn(
-                "dq_score",
-                ((F.lit(total_weight) - F.col("_dq_fail_weight")) /
-                F.lit(total_weight) * 100.0)
-            )
+            score_col = (F.lit(total_weight) - fail_weight_col) / F.lit(total_weight) * 100.0
         else:
             # No rules → score = 100
-            annotated = annotated.withColumn("dq_score", F.lit(100.0))
+            score_col = F.lit(100.0)
 
         # ---------------------------------------------------------
-        # 5. Always create _dq_error
+        # 3. Add all DQ columns in a single projection
+        #    (one plan node instead of one per withColumn)
         # ---------------------------------------------------------
-        annotated = annotated.withColumn(
-            "_dq_error",
-            F.col("_dq_fail_weight") > 0
+        base_cols = [c for c in df.columns if c not in DQ_COLUMNS]
+        annotated = evaluated.select(
+            *base_cols,
+            failures_col.alias("_dq_failures"),
+            fail_weight_col.alias("_dq_fail_weight"),
+            score_col.alias("dq_score"),
+            (fail_weight_col > 0).alias("_dq_error")
         )
 
         # ---------------------------------------------------------
@@ -562,44 +740,45 @@ class DQEngine:
         #    FIXED: Make lineage columns conditional
         # ---------------------------------------------------------
         
-        # Build select list dynamically
-        select_cols = []
-        
         # Add lineage/tracking columns if they exist
-        if "process_queue_id" in df.columns:
-            select_cols.append("process_queue_id")
-        if "natural_key_hash" in df.columns:
-            select_cols.append("natural_key_hash")
-        if "processed_at" in df.columns:
-            select_cols.append("processed_at")
-        
-        # Always add failure details
-        select_cols.extend([
-            "failure.rule",
-            "failure.column",
-            "failure.failed_value",
-            "failure.weight",
-            "dq_score",
-            "_dq_error"
-        ])
-        
+        lineage_cols = [
+            c for c in ("process_queue_id", "natural_key_hash", "processed_at")
+            if c in base_cols
+        ]
+
+        # Only the columns the error report needs are carried through the
+        # explode, so the rest of the record can be pruned from the scan
         errors_df = (
             annotated
-                .filter(F.col("_dq_error") == True)
+                .where(F.col("_dq_error"))
                 .select(
-                    *df.columns,  # retain original record
+                    *lineage_cols,
                     F.explode_outer("_dq_failures").alias("failure"),
                     "dq_score",
                     "_dq_error"
                 )
-                .select(*select_cols)
+                .select(
+                    *lineage_cols,
+                    "failure.rule",
+                    "failure.column",
+                    "failure.failed_value",
+                    "failure.weight",
+                    "dq_score",
+                    "_dq_error"
+                )
         )
 
         # ---------------------------------------------------------
         # 7. Summary dictionary
         # ---------------------------------------------------------
-        total_rows = df.count()
-        failed_rows = errors_df.select("process_queue_id" if "process_queue_id" in df.columns else F.lit(1)).distinct().count() if errors_df.count() > 0 else 0
+        # Both counts come from one aggregation over the annotated frame
+        # (a single Spark job) rather than separate count() actions
+        counts = annotated.agg(
+            F.count(F.lit(1)).alias("total_rows"),
+            F.sum(F.col("_dq_error").cast("long")).alias("failed_rows")
+        ).first()
+        total_rows = counts["total_rows"]
+        failed_rows = counts["failed_rows"] or 0
 
         summary = {
             "total_rows": total_rows,
@@ -610,4 +789,28 @@ class DQEngine:
             "total_weight": total_weight,
         }
 
-        return summary, annotated, errors_df
\ No newline at end of file
+        return summary, annotated, errors_df
+
+
+def _build_handlers(cls):
+    """
+    Populate the rule dispatch tables for a DQEngine class.
+    
+    Maps 'trim' -> 'clean_trim', 'not_null' -> 'rule_not_null', etc.
+    so apply_cleansing/apply_dq skip formatting a name per rule. Handlers
+    are still resolved with getattr on the instance, so instance-level
+    overrides and patched methods take effect.
+    """
+    cls._CLEAN_HANDLERS = {
+        name[len("clean_"):]: name
+        for name in dir(cls)
+        if name.startswith("clean_")
+    }
+    cls._DQ_HANDLERS = {
+        name[len("rule_"):]: name
+        for name in dir(cls)
+        if name.startswith("rule_")
+    }
+
+
+_build_handlers(DQEngine)
@@ -0,0 +1,182 @@
+"""
+Tests for GRANT/REVOKE executor.
+
+Tests batching and execution of privilege deltas.
+Uses mocks for Spark session since we don't have actual UC access in tests.
+"""
+
+import pytest
+from unittest.mock import Mock
+from access.grant_revoker import GrantRevoker
+from access.models import PrivilegeDelta, UCPrivilege
+
+
+@pytest.fixture
+def mock_spark():
+    """Create a mock Spark session."""
+    return Mock()
+
+
+@pytest.fixture
+def revoker(mock_spark):
+    """Create a grant/revoke executor with mock Spark."""
+    return GrantRevoker(mock_spark)
+
+
+def make_delta(action, ad_group, privilege=UCPrivilege.SELECT, table="catalog.schema.table1"):
+    """Build a delta with a fixed reason."""
+    return PrivilegeDelta(
+        action=action,
+        table=table,
+        ad_group=ad_group,
+        privilege=privilege,
+        reason="test"
+    )
+
+
+class TestGrantRevoker:
+    """Test GrantRevoker class."""
+
+    def test_apply_deltas_counts(self, revoker, mock_spark):
+        """Test GRANT and REVOKE counters."""
+        deltas = [
+            make_delta("GRANT", "ad_grp_new1"),
+            make_delta("GRANT", "ad_grp_new2"),
+            make_delta("REVOKE", "ad_grp_old"),
+        ]
+
+        result = revoker.apply_deltas(
+            table="catalog.schema.table1",
+            deltas=deltas,
+            intended_count=2,
+            actual_count=1,
+            no_change_count=0
+        )
+
+        assert mock_spark.sql.call_count == 3
+        assert result.grants_attempted == 2
+        assert result.grants_succeeded == 2
+        assert result.revokes_attempted == 1
+        assert result.revokes_succeeded == 1
+        assert result.is_successful
+
+    def test_privileges_for_same_group_are_batched(self, revoker, mock_spark):
+        """Test multiple privileges for one group use one statement."""
+        deltas = [
+            make_delta("GRANT", "ad_grp_test", UCPrivilege.SELECT),
+            make_delta("GRANT", "ad_grp_test", UCPrivilege.MODIFY),
+        ]
+
+        result = revoker.apply_deltas("catalog.schema.table1", deltas, 2, 0, 0)
+
+        mock_spark.sql.assert_called_once_with(
+            "GRANT SELECT, MODIFY ON TABLE catalog.schema.table1 TO `ad_grp_test`"
+        )
+        assert result.grants_attempted == 2
+        assert result.grants_succeeded == 2
+
+    def test_all_privileges_not_batched(self, revoker, mock_spark):
+        """Test ALL PRIVILEGES is issued as its own statement."""
+        deltas = [
+            make_delta("GRANT", "ad_grp_admin", UCPrivilege.SELECT),
+            make_delta("GRANT", "ad_grp_admin", UCPrivilege.ALL_PRIVILEGES),
+        ]
+
+        revoker.apply_deltas("catalog.schema.table1", deltas, 2, 0, 0)
+
+        assert mock_spark.sql.call_count == 2
+
+    def test_failed_batch_counts_every_privilege(self, revoker, mock_spark):
+        """Test a failed batch is retried per delta and each failure counted."""
+        mock_spark.sql.side_effect = Exception("Group not found")
+        deltas = [
+            make_delta("REVOKE", "ad_grp_old", UCPrivilege.SELECT),
+            make_delta("REVOKE", "ad_grp_old", UCPrivilege.MODIFY),
+        ]
+
+        result = revoker.apply_deltas("catalog.schema.table1", deltas, 0, 2, 0)
+
+        assert mock_spark.sql.call_count == 3
+        assert result.revokes_attempted == 2
+        assert result.revokes_failed == 2
+        assert len(result.errors) == 2
+        assert "REVOKE failed for ad_grp_old" in result.errors[0]
+        assert not result.is_successful
+
+    def test_partly_failing_batch_applies_valid_privileges(self, revoker, mock_spark):
+        """Test one rejected privilege does not block the rest of its batch."""
+        def run_sql(sql):
+            if "MODIFY" in sql:
+                raise Exception("MODIFY is not supported on views")
+
+        mock_spark.sql.side_effect = run_sql
+        deltas = [
+            make_delta("GRANT", "ad_grp_test", UCPrivilege.SELECT),
+            make_delta("GRANT", "ad_grp_test", UCPrivilege.MODIFY),
+        ]
+
+        result = revoker.apply_deltas("catalog.schema.table1", deltas, 2, 0, 0)
+
+        mock_spark.sql.assert_any_call(
+            "GRANT SELECT ON TABLE catalog.schema.table1 TO `ad_grp_test`"
+        )
+        assert result.grants_attempted == 2
+        assert result.grants_succeeded == 1
+        assert result.grants_failed == 1
+        assert len(result.errors) == 1
+        assert "MODIFY is not supported" in result.errors[0]
+
+    def test_dry_run_does_not_execute(self, mock_spark):
+        """Test dry run skips SQL execution."""
+        revoker = GrantRevoker(mock_spark, dry_run=True)
+
+        result = revoker.apply_deltas(
+            "catalog.schema.table1",
+            [make_delta("GRANT", "ad_grp_test")],
+            1, 0, 0
+        )
+
+        mock_spark.sql.assert_not_called()
+        assert result.grants_succeeded == 1
+
+    def test_errors_are_bounded(self, revoker, mock_spark, monkeypatch):
+        """Test only the most recent errors are kept on the result."""
+        monkeypatch.setattr("access.grant_revoker.MAX_RESULT_ERRORS", 2)
+        mock_spark.sql.side_effect = Exception("Group not found")
+        deltas = [make_delta("GRANT", f"ad_grp_{i}") for i in range(5)]
+
+        result = revoker.apply_deltas("catalog.schema.table1", deltas, 5, 0, 0)
+
+        assert result.grants_failed == 5
+        assert len(result.errors) == 2
+        assert result.errors_dropped == 3
+
+    def test_many_batches_all_executed(self, mock_spark):
+        """Test every statement runs when batches exceed the in-flight window."""
+        revoker = GrantRevoker(mock_spark, max_workers=2)
+        deltas = [make_delta("GRANT", f"ad_grp_{i}") for i in range(25)]
+
+        result = revoker.apply_deltas("catalog.schema.table1", deltas, 25, 0, 0)
+
+        assert mock_spark.sql.call_count == 25
+        assert result.grants_succeeded == 25
+
+    def test_grants_run_before_revokes_for_same_group(self, mock_spark):
+        """Test a group's REVOKE never runs ahead of its GRANT."""
+        revoker = GrantRevoker(mock_spark, max_workers=4)
+        deltas = [
+            make_delta("REVOKE", "ad_grp_a", UCPrivilege.ALL_PRIVILEGES),
+            make_delta("GRANT", "ad_grp_b"),
+            make_delta("GRANT", "ad_grp_a"),
+            make_delta("REVOKE", "ad_grp_b", UCPrivilege.MODIFY)
+        ]
+
+        result = revoker.apply_deltas("catalog.schema.table1", deltas, 2, 2, 0)
+
+        statements = [c.args[0] for c in mock_spark.sql.call_args_list]
+        for group in ("ad_grp_a", "ad_grp_b"):
+            group_statements = [s for s in statements if f"`{group}`" in s]
+            assert group_statements[0].startswith("GRANT")
+            assert group_statements[1].startswith("REVOKE")
+        assert result.grants_succeeded == 2
+        assert result.revokes_succeeded == 2
@@ -316,6 +316,19 @@ class TestPrivilegeDelta:
         expected = "GRANT ALL PRIVILEGES ON TABLE catalog.schema.table1 TO `ad_grp_admin`"
         assert delta.sql == expected
 
+    def test_delta_is_immutable(self):
+        """Test deltas cannot be modified after SQL is rendered."""
+        delta = PrivilegeDelta(
+            action="GRANT",
+            table="catalog.schema.table1",
+            ad_group="ad_grp_test",
+            privilege=UCPrivilege.SELECT,
+            reason="Test"
+        )
+
+        with pytest.raises(AttributeError):
+            delta.ad_group = "ad_grp_other"
+
 
 class TestAccessControlResult:
     """Test AccessControlResult dataclass."""
@@ -309,3 +309,18 @@ class TestUCPrivilegeInspector:
 
             # Should always return empty list on error
             assert len(actuals) == 0
+
+    def test_get_actual_privileges_is_not_cached(self, inspector, mock_spark):
+        """Test every lookup runs SHOW GRANTS so changes made outside are seen."""
+        mock_df = Mock()
+        mock_df.collect.return_value = [
+            MockRow("ad_grp_test", "GROUP", "SELECT", "TABLE", "catalog.schema.table1"),
+        ]
+        mock_spark.sql.return_value = mock_df
+
+        inspector.get_actual_privileges("catalog", "schema", "table1")
+        mock_df.collect.return_value = []
+        actuals = inspector.get_actual_privileges("catalog", "schema", "table1")
+
+        assert mock_spark.sql.call_count == 2
+        assert actuals == []
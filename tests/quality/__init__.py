@@ -0,0 +1 @@
+"""Tests for the data quality module."""
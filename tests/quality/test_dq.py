@@ -0,0 +1,211 @@
+"""
+Tests for DQEngine cleansing rule planning.
+
+Covers the pure-Python passes that run before any Spark expression is
+built.
+"""
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+from nova_framework.quality.dq import DQEngine
+
+
+@pytest.fixture
+def engine():
+    """Create a DQ engine."""
+    return DQEngine()
+
+
+class TestDedupeCleansingRules:
+    """Tests for DQEngine._dedupe_cleansing_rules."""
+
+    def test_repeated_idempotent_rule_dropped(self, engine):
+        """A repeat of the same idempotent rule on a column is dropped."""
+        rules = [
+            {"rule": "trim", "column": "name"},
+            {"rule": "trim", "column": "name"},
+            {"rule": "upper", "column": "name"},
+            {"rule": "upper", "column": "name"}
+        ]
+
+        deduped = engine._dedupe_cleansing_rules(rules)
+
+        assert deduped == [
+            {"rule": "trim", "column": "name"},
+            {"rule": "upper", "column": "name"}
+        ]
+
+    def test_intervening_rule_keeps_repeat(self, engine):
+        """A different rule on the column in between keeps the repeat."""
+        rules = [
+            {"rule": "trim", "column": "name"},
+            {"rule": "regex_replace", "column": "name", "pattern": "x", "replacement": "  "},
+            {"rule": "trim", "column": "name"}
+        ]
+
+        deduped = engine._dedupe_cleansing_rules(rules)
+
+        assert deduped == rules
+
+    def test_intervening_idempotent_rule_keeps_repeat(self, engine):
+        """trim, upper, trim keeps both trims."""
+        rules = [
+            {"rule": "trim", "column": "name"},
+            {"rule": "upper", "column": "name"},
+            {"rule": "trim", "column": "name"}
+        ]
+
+        assert engine._dedupe_cleansing_rules(rules) == rules
+
+    def test_rule_on_other_column_does_not_keep_repeat(self, engine):
+        """Rules on unrelated columns don't break the run."""
+        rules = [
+            {"rule": "trim", "column": "name"},
+            {"rule": "upper", "column": "status"},
+            {"rule": "trim", "column": "name"}
+        ]
+
+        deduped = engine._dedupe_cleansing_rules(rules)
+
+        assert deduped == rules[:2]
+
+    def test_partly_redundant_multi_column_rule(self, engine):
+        """Only the redundant columns are removed from a multi-column rule."""
+        rules = [
+            {"rule": "trim", "column": "name"},
+            {"rule": "trim", "columns": ["name", "email"]}
+        ]
+        original = copy.deepcopy(rules)
+
+        deduped = engine._dedupe_cleansing_rules(rules)
+
+        assert deduped == [
+            {"rule": "trim", "column": "name"},
+            {"rule": "trim", "columns": ["email"]}
+        ]
+        assert rules == original
+
+    def test_fully_redundant_multi_column_rule_dropped(self, engine):
+        """A multi-column rule with every column covered is dropped."""
+        rules = [
+            {"rule": "lower", "columns": ["a", "b"]},
+            {"rule": "lower", "columns": ["b", "a"]}
+        ]
+
+        deduped = engine._dedupe_cleansing_rules(rules)
+
+        assert deduped == [{"rule": "lower", "columns": ["a", "b"]}]
+
+    def test_partly_redundant_boolean_rule_uses_columns(self, engine):
+        """A trimmed normalize_boolean_values rule keeps its other columns."""
+        rules = [
+            {"rule": "normalize_boolean_values", "column": "active"},
+            {"rule": "normalize_boolean_values", "columns": ["active", "deleted"]}
+        ]
+
+        deduped = engine._dedupe_cleansing_rules(rules)
+
+        assert deduped[1] == {"rule": "normalize_boolean_values", "columns": ["deleted"]}
+
+    def test_non_idempotent_rules_kept(self, engine):
+        """Rules outside the idempotent set are never dropped."""
+        rules = [
+            {"rule": "regex_replace", "column": "name", "pattern": "a", "replacement": "aa"},
+            {"rule": "regex_replace", "column": "name", "pattern": "a", "replacement": "aa"}
+        ]
+
+        assert engine._dedupe_cleansing_rules(rules) == rules
+
+
+class TestFuseRegexRules:
+    """Tests for DQEngine._fuse_regex_rules."""
+
+    def test_consecutive_same_column_fused(self, engine):
+        """Consecutive regex rules on one column become a single rule."""
+        rules = [
+            {"rule": "regex_replace", "column": "phone", "pattern": "-", "replacement": ""},
+            {"rule": "regex_replace", "column": "phone", "pattern": " ", "replacement": ""},
+            {"rule": "regex_replace", "column": "phone", "pattern": "^0"}
+        ]
+        original = copy.deepcopy(rules)
+
+        fused = engine._fuse_regex_rules(rules)
+
+        assert fused == [{
+            "rule": "regex_replace",
+            "column": "phone",
+            "replacements": [("-", ""), (" ", ""), ("^0", "")]
+        }]
+        assert rules == original
+
+    def test_different_columns_not_fused(self, engine):
+        """Consecutive regex rules on different columns stay separate."""
+        rules = [
+            {"rule": "regex_replace", "column": "a", "pattern": "x", "replacement": "y"},
+            {"rule": "regex_replace", "column": "b", "pattern": "x", "replacement": "y"}
+        ]
+
+        fused = engine._fuse_regex_rules(rules)
+
+        assert [r["column"] for r in fused] == ["a", "b"]
+        assert [r["replacements"] for r in fused] == [[("x", "y")], [("x", "y")]]
+
+    def test_non_consecutive_same_column_not_fused(self, engine):
+        """An intervening rule splits a regex run into two rules."""
+        rules = [
+            {"rule": "regex_replace", "column": "a", "pattern": "x", "replacement": "y"},
+            {"rule": "upper", "column": "a"},
+            {"rule": "regex_replace", "column": "a", "pattern": "Y", "replacement": "z"}
+        ]
+
+        fused = engine._fuse_regex_rules(rules)
+
+        assert fused == [
+            {"rule": "regex_replace", "column": "a", "replacements": [("x", "y")]},
+            {"rule": "upper", "column": "a"},
+            {"rule": "regex_replace", "column": "a", "replacements": [("Y", "z")]}
+        ]
+
+    def test_regex_rule_on_other_column_splits_run(self, engine):
+        """A regex rule on another column between two on the same column splits the run."""
+        rules = [
+            {"rule": "regex_replace", "column": "a", "pattern": "1", "replacement": ""},
+            {"rule": "regex_replace", "column": "b", "pattern": "2", "replacement": ""},
+            {"rule": "regex_replace", "column": "a", "pattern": "3", "replacement": ""}
+        ]
+
+        fused = engine._fuse_regex_rules(rules)
+
+        assert [(r["column"], r["replacements"]) for r in fused] == [
+            ("a", [("1", "")]),
+            ("b", [("2", "")]),
+            ("a", [("3", "")])
+        ]
+
+
+class TestRuleDispatch:
+    """Tests for cleansing and validation rule dispatch."""
+
+    def test_instance_override_is_used(self, engine):
+        """A handler replaced on the instance is the one called."""
+        df, cleaned = Mock(), Mock()
+        engine.clean_trim = Mock(return_value=cleaned)
+        rule = {"rule": "trim", "column": "name"}
+
+        result = engine.apply_cleansing(df, [rule])
+
+        engine.clean_trim.assert_called_once_with(df, rule)
+        assert result is cleaned
+
+    def test_subclass_rule_is_dispatched(self):
+        """A clean_* method added by a subclass is picked up."""
+
+        class CustomEngine(DQEngine):
+            def clean_strip_zeros(self, df, rule):
+                return "stripped"
+
+        result = CustomEngine().apply_cleansing(Mock(), [{"rule": "strip_zeros", "column": "id"}])
+
+        assert result == "stripped"